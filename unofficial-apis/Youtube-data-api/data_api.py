@@ -1,16 +1,58 @@
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse, PlainTextResponse
+from contextlib import asynccontextmanager, contextmanager
+from aiolimiter import AsyncLimiter
+import asyncio
+import hashlib
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api._errors import (
+    CouldNotRetrieveTranscript, TranscriptsDisabled, NoTranscriptFound, RequestBlocked, YouTubeRequestFailed
+)
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, stop_before_delay, wait_exponential_jitter
+import anyio
+import orjson
+import redis.asyncio as redis
 import yt_dlp
-import re
+import re2
 import uvicorn
-from typing import Optional
+from types import SimpleNamespace
+from typing import Iterator, Optional
+import multiprocessing
+import operator
 import os
+import sys
+import threading
+import time
 
 # Configuration from environment variables
 YOUTUBE_API_HOST = os.getenv("YOUTUBE_API_HOST", "0.0.0.0")
 YOUTUBE_API_PORT = int(os.getenv("YOUTUBE_API_PORT", "8000"))
+YOUTUBE_API_THREAD_LIMIT = int(os.getenv("YOUTUBE_API_THREAD_LIMIT", "200"))
+YOUTUBE_API_PROCESS_WORKERS = int(os.getenv("YOUTUBE_API_PROCESS_WORKERS", "0"))  # yt-dlp process pool size, 0 runs it on threads
+YOUTUBE_API_RATE_LIMIT = float(os.getenv("YOUTUBE_API_RATE_LIMIT", "5"))  # Calls to YouTube per second, 0 for no limit
+YOUTUBE_API_REDIS_URL = os.getenv("YOUTUBE_API_REDIS_URL")  # e.g. redis://redis:6379/0, Redis caching is off when unset
+
+# Cache lifetimes in seconds
+METADATA_CACHE_TTL = 86400  # 24 hours
+TRANSCRIPT_CACHE_TTL = 604800  # 7 days
+COMMENTS_CACHE_TTL = 3600  # 1 hour
+
+# How long clients and proxies may reuse responses (Cache-Control max-age)
+METADATA_MAX_AGE = 3600  # 1 hour
+TRANSCRIPT_MAX_AGE = 1800  # 30 minutes
+COMMENTS_MAX_AGE = 300  # 5 minutes
+
+# In-process cache checked before Redis, so hot videos skip the round-trip
+MEMORY_CACHE_SIZE = 1024
+MEMORY_CACHE_TTL = 60
+
+if YOUTUBE_API_RATE_LIMIT < 0:
+    raise ValueError("YOUTUBE_API_RATE_LIMIT must be >= 0 (0 turns rate limiting off)")
 
 """
 YouTube Data Extractor API - NO VIDEO DOWNLOADS!
@@ -23,27 +65,486 @@ Data Sources:
 - Metadata/Comments: yt-dlp (web scraping, no downloads, no quota limits)
 """
 
+_redis: Optional[redis.Redis] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Only touched from the event loop thread, so it needs no lock
+_memory_cache = TTLCache(maxsize=MEMORY_CACHE_SIZE, ttl=MEMORY_CACHE_TTL)
+
+# Extractions currently running, by cache key, so concurrent requests for the
+# same video share one scrape instead of each hitting YouTube
+_inflight: dict[str, asyncio.Future] = {}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # yt-dlp and youtube-transcript-api are blocking, so every request occupies
+    # a worker thread while it waits on YouTube. Raise AnyIO's default of 40.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = YOUTUBE_API_THREAD_LIMIT
+
+    global _redis, _process_pool
+    if YOUTUBE_API_REDIS_URL:
+        # Short timeouts so an unreachable Redis is a quick cache miss rather
+        # than stalling every request
+        _redis = redis.from_url(YOUTUBE_API_REDIS_URL, socket_connect_timeout=0.5, socket_timeout=0.5)
+    if YOUTUBE_API_PROCESS_WORKERS > 0:
+        # spawn rather than fork - forking a process that already runs threads
+        # can leave locks held in the child
+        _process_pool = ProcessPoolExecutor(
+            max_workers=YOUTUBE_API_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    yield
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 app = FastAPI(
     title="YouTube Data Extractor API",
     description="Extract transcripts, metadata, comments, and more from YouTube videos (NO VIDEO DOWNLOADS)",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-def extract_video_id(url: str) -> str:
+# Transcripts and comment lists are repetitive text and compress very well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Matches the 11-character video ID after "v=" or any "/" - this also covers
+# youtu.be/, embed/ and v/ style URLs. Compiled once at import time with RE2,
+# whose automaton-based matching is linear in the URL length for any input.
+_VIDEO_ID_RE = re2.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+
+def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from various YouTube URL formats."""
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'youtu\.be\/([0-9A-Za-z_-]{11})',
-        r'embed\/([0-9A-Za-z_-]{11})',
-        r'v\/([0-9A-Za-z_-]{11})'
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+def get_video_id(url: str = Query(..., description="YouTube video URL")) -> str:
+    """Dependency that resolves the url query parameter to a video ID."""
+    video_id = extract_video_id(url)
+    if not video_id:
+        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    return video_id
+
+def _video_url(video_id: str) -> str:
+    return f'https://www.youtube.com/watch?v={video_id}'
+
+# Shared across requests so its HTTP session keeps connections (and TLS
+# sessions) to YouTube alive instead of reconnecting on every call
+_TRANSCRIPT_API = YouTubeTranscriptApi()
+
+# IMPORTANT: These options prevent any video download
+# We only extract metadata (and optionally comments) from the YouTube page
+_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,  # Never download video files
+    'extract_flat': False,  # Get full metadata but no download
+    'noplaylist': True,  # Don't process playlists
+    'no_color': True,
+    # We never use the stream formats, so don't fetch and parse the DASH/HLS
+    # manifests or build translated subtitle lists
+    'extractor_args': {'youtube': {'skip': ['dash', 'hls', 'translated_subs']}},
+    # Live, upcoming and post-live videos only have manifest formats, so with
+    # those skipped they end up with none - return their metadata anyway
+    'ignore_no_formats_error': True
+}
+
+# Idle YoutubeDL instances shared by all worker threads, as (max_comments,
+# instance) pairs with the most recently returned last. They live here rather
+# than on the threads, which AnyIO retires after a few idle seconds.
+_YDL_POOL_SIZE = 16
+
+_ydl_idle: list[tuple[Optional[int], yt_dlp.YoutubeDL]] = []
+_ydl_lock = threading.Lock()
+
+def _new_ydl(max_comments: Optional[int]) -> yt_dlp.YoutubeDL:
+    opts = dict(_YDL_OPTS)
+    if max_comments is not None:
+        opts['getcomments'] = True
+        opts['extractor_args'] = {
+            'youtube': {**_YDL_OPTS['extractor_args']['youtube'], 'max_comments': [str(max_comments)]}
+        }
+    return yt_dlp.YoutubeDL(opts)
+
+@contextmanager
+def _ydl(max_comments: Optional[int] = None) -> Iterator[yt_dlp.YoutubeDL]:
+    """
+    Check out a YoutubeDL for metadata only (max_comments=None) or for
+    metadata plus up to max_comments comments.
+
+    YoutubeDL isn't thread-safe, so an instance is used by one thread at a
+    time and goes back to the shared pool afterwards. Instances pushed out
+    of the pool are closed.
+    """
+    ydl = None
+    with _ydl_lock:
+        for i in range(len(_ydl_idle) - 1, -1, -1):
+            if _ydl_idle[i][0] == max_comments:
+                ydl = _ydl_idle.pop(i)[1]
+                break
+    if ydl is None:
+        ydl = _new_ydl(max_comments)
+
+    try:
+        yield ydl
+    finally:
+        evicted = None
+        with _ydl_lock:
+            _ydl_idle.append((max_comments, ydl))
+            if len(_ydl_idle) > _YDL_POOL_SIZE:
+                evicted = _ydl_idle.pop(0)[1]
+        if evicted is not None:
+            evicted.close()
+
+# Blocking helpers - yt-dlp and youtube-transcript-api do synchronous network
+# I/O, so endpoints run these through _run_blocking to keep the event loop
+# free for other requests.
+
+def _extract_metadata_sync(video_id: str) -> dict:
+    """Scrape video metadata with yt-dlp."""
+    with _ydl() as ydl:
+        info = ydl.extract_info(_video_url(video_id), download=False)
+
+    return _build_metadata(video_id, info)
+
+def _extract_comments_sync(video_id: str, max_comments: int) -> tuple[dict, list]:
+    """Scrape metadata and up to max_comments comments with a single yt-dlp call."""
+    with _ydl(max_comments) as ydl:
+        info = ydl.extract_info(_video_url(video_id), download=False)
+
+    comments = [
+        {
+            "author": comment.get('author'),
+            "text": comment.get('text'),
+            "like_count": comment.get('like_count'),
+            "timestamp": comment.get('timestamp'),
+            "is_favorited": comment.get('is_favorited', False),
+            "parent": comment.get('parent', 'root')
+        }
+        for comment in islice(info.get('comments') or (), max_comments)
     ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+
+    return _build_metadata(video_id, info), comments
+
+def _extract_related_sync(video_id: str, limit: int) -> list:
+    """Scrape related/suggested videos with yt-dlp."""
+    with _ydl() as ydl:
+        info = ydl.extract_info(_video_url(video_id), download=False)
+
+    # YouTube doesn't always provide related videos in the API
+    # But we can get some suggestions from the video info
+    related = []
+
+    # Try to get related videos from various fields
+    if 'entries' in info:
+        for entry in info['entries'][:limit]:
+            related.append({
+                "video_id": entry.get('id'),
+                "title": entry.get('title'),
+                "channel": entry.get('channel'),
+                "duration": entry.get('duration'),
+                "view_count": entry.get('view_count')
+            })
+
+    return related
+
+_segment_fields = operator.attrgetter('text', 'start', 'duration')
+
+def _fetch_transcript_sync(video_id: str, lang: Optional[str] = None) -> list:
+    """Fetch a transcript, optionally restricted to a single language."""
+    if lang:
+        transcript = _TRANSCRIPT_API.fetch(video_id, languages=[lang])
+    else:
+        transcript = _TRANSCRIPT_API.fetch(video_id)
+
+    return [
+        {"text": text, "start": start, "duration": duration}
+        for text, start, duration in map(_segment_fields, transcript)
+    ]
+
+def _list_languages_sync(video_id: str) -> list:
+    """List the transcript languages available for a video."""
+    transcript_list = _TRANSCRIPT_API.list(video_id)
+
+    return [
+        {
+            "language": t.language,
+            "language_code": t.language_code,
+            "is_generated": t.is_generated,
+            "is_translatable": t.is_translatable
+        }
+        for t in transcript_list
+    ]
+
+def _build_metadata(video_id: str, info: dict) -> dict:
+    return {
+        "video_id": video_id,
+        "title": info.get('title'),
+        "description": info.get('description'),
+        "duration": info.get('duration'),
+        "duration_string": info.get('duration_string'),
+        "view_count": info.get('view_count'),
+        "like_count": info.get('like_count'),
+        "upload_date": info.get('upload_date'),
+        "uploader": info.get('uploader'),
+        "channel": info.get('channel'),
+        "channel_id": info.get('channel_id'),
+        "channel_url": info.get('channel_url'),
+        "subscriber_count": info.get('channel_follower_count'),
+        "categories": info.get('categories', []),
+        "tags": info.get('tags', []),
+        "thumbnails": info.get('thumbnails', []),
+        "webpage_url": info.get('webpage_url')
+    }
+
+# Subsets of the metadata/comment fields returned by /full
+_FULL_METADATA_FIELDS = (
+    "title", "description", "duration", "view_count", "like_count",
+    "upload_date", "channel", "channel_id", "tags", "categories"
+)
+_FULL_COMMENT_FIELDS = ("author", "text", "like_count")
+
+# Spaces out calls to YouTube so bursts don't get the server rate limited.
+# With Redis the limit is counted there and shared by all gunicorn workers;
+# otherwise (or while Redis is unreachable) each worker applies it on its own.
+_limiter: Optional[AsyncLimiter] = None
+if YOUTUBE_API_RATE_LIMIT > 0:
+    # Limiters can't hold less than one call, so slow rates stretch the window
+    _rate_window = max(1.0, 1 / YOUTUBE_API_RATE_LIMIT)
+    _rate_calls = YOUTUBE_API_RATE_LIMIT * _rate_window
+    _limiter = AsyncLimiter(_rate_calls, _rate_window)
+
+async def _wait_for_rate_limit():
+    """Wait until a call to YouTube fits within YOUTUBE_API_RATE_LIMIT."""
+    if _limiter is None:
+        return
+    if _redis is None:
+        await _limiter.acquire()
+        return
+
+    while True:
+        window = int(time.time() / _rate_window)
+        key = f"yt:ratelimit:{window}"
+        try:
+            async with _redis.pipeline(transaction=True) as pipe:
+                calls, _ = await pipe.incr(key).expire(key, int(_rate_window) + 1).execute()
+        except redis.RedisError:
+            await _limiter.acquire()
+            return
+        if calls <= _rate_calls:
+            return
+        await asyncio.sleep((window + 1) * _rate_window - time.time())
+
+# Seconds clients are told to wait when YouTube keeps failing
+RETRY_AFTER = 30
+
+# Seconds to keep retrying a failing YouTube call before answering 503. Counts
+# rate limit waits too, so the request (and anyone sharing its extraction)
+# isn't held for minutes.
+RETRY_DEADLINE = 20
+
+def _is_expected_download_error(exc: yt_dlp.utils.DownloadError) -> bool:
+    # yt-dlp marks errors such as private or removed videos as expected
+    cause = exc.exc_info[1] if exc.exc_info else None
+    return getattr(cause, 'expected', False)
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed YouTube call is worth retrying (rate limits, network errors)."""
+    if isinstance(exc, (RequestBlocked, YouTubeRequestFailed)):
+        return True
+    if isinstance(exc, yt_dlp.utils.DownloadError):
+        return not _is_expected_download_error(exc)
+    return False
+
+# yt-dlp spends real CPU time parsing YouTube's pages. When a process pool is
+# configured these helpers run there, so parsing isn't serialized by the GIL.
+# Transcript calls are mostly waiting on the network and stay on threads.
+_PROCESS_POOL_FUNCS = {_extract_metadata_sync, _extract_comments_sync, _extract_related_sync}
+
+def _run_in_process(func, *args):
+    """
+    Process pool entry point. yt-dlp errors hold tracebacks that can't be
+    pickled back to the server process, so re-raise a plain copy that keeps
+    the message and whether the error was expected.
+    """
+    try:
+        return func(*args)
+    except yt_dlp.utils.DownloadError as e:
+        cause = SimpleNamespace(expected=_is_expected_download_error(e))
+        raise yt_dlp.utils.DownloadError(e.msg, (None, cause, None)) from None
+
+async def _run_sync(func, *args):
+    if _process_pool is not None and func in _PROCESS_POOL_FUNCS:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_process_pool, partial(_run_in_process, func, *args))
+    return await anyio.to_thread.run_sync(func, *args)
+
+async def _run_blocking(func, *args):
+    """
+    Run a blocking YouTube call in a worker thread (or the process pool),
+    rate limited and retried with exponential backoff on transient failures.
+    """
+    retrying = AsyncRetrying(
+        wait=wait_exponential_jitter(1, 30),
+        stop=stop_after_attempt(5) | stop_before_delay(RETRY_DEADLINE),
+        retry=retry_if_exception(_is_transient),
+        reraise=True
+    )
+
+    try:
+        async for attempt in retrying:
+            with attempt:
+                await _wait_for_rate_limit()
+                return await _run_sync(func, *args)
+    except Exception as e:
+        if not _is_transient(e):
+            raise
+        raise HTTPException(
+            status_code=503,
+            detail="YouTube is not responding, try again later",
+            headers={"Retry-After": str(RETRY_AFTER)}
+        ) from e
+
+async def _cache_get(key: str):
+    """Look key up in the in-process cache, then in Redis."""
+    value = _memory_cache.get(key)
+    if value is not None or _redis is None:
+        return value
+
+    try:
+        cached = await _redis.get(key)
+    except redis.RedisError:
+        return None
+    if cached is None:
+        return None
+
+    value = _memory_cache[key] = orjson.loads(cached)
+    return value
+
+async def _cache_set(key: str, value, ttl: int):
+    _memory_cache[key] = value
+    if _redis is None:
+        return
+
+    try:
+        await _redis.set(key, orjson.dumps(value), ex=ttl)
+    except redis.RedisError:
+        pass
+
+async def _cached(key: str, ttl: int, func, *args):
+    """
+    Return the cached result for key, or run func through _run_blocking and cache it.
+
+    Concurrent misses for the same key share a single call to func: the first
+    caller runs it and the rest await its future, getting the same result or
+    exception.
+    """
+    while True:
+        cached = await _cache_get(key)
+        if cached is not None:
+            return cached
+
+        future = _inflight.get(key)
+        if future is None:
+            break
+
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The request running func was cancelled - try again ourselves
+
+    future = _inflight[key] = asyncio.get_running_loop().create_future()
+    try:
+        result = await _run_blocking(func, *args)
+        await _cache_set(key, result, ttl)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Nobody may be waiting, don't log it as unretrieved
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+async def _get_metadata(video_id: str) -> dict:
+    return await _cached(f"yt:meta:{video_id}", METADATA_CACHE_TTL, _extract_metadata_sync, video_id)
+
+async def _get_comments(video_id: str, max_comments: int) -> tuple[dict, list]:
+    metadata, comments = await _cached(
+        f"yt:comments:{video_id}:{max_comments}", COMMENTS_CACHE_TTL,
+        _extract_comments_sync, video_id, max_comments
+    )
+    return metadata, comments
+
+async def _get_transcript(video_id: str, lang: Optional[str] = None) -> list:
+    return await _cached(
+        f"yt:transcript:{video_id}:{lang or ''}", TRANSCRIPT_CACHE_TTL,
+        _fetch_transcript_sync, video_id, lang
+    )
+
+async def _stream_transcript_text(transcript: list, batch_size: int = 256):
+    """Yield the space-separated transcript text a batch of segments at a time."""
+    for i in range(0, len(transcript), batch_size):
+        text = " ".join(segment["text"] for segment in transcript[i:i + batch_size])
+        yield text if i == 0 else " " + text
+
+def _metadata_etag(metadata: dict) -> str:
+    # Hash of the response body, so the tag changes whenever the cached
+    # metadata is refreshed. Weak, since GZipMiddleware serves it for both
+    # encodings.
+    digest = hashlib.blake2b(orjson.dumps(metadata), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header covers etag (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+# Errors from the YouTube clients are mapped to HTTP responses here instead of
+# in every endpoint. Anything else propagates to the server as a plain 500.
+
+def _error_response(status_code: int, detail: str) -> ORJSONResponse:
+    return ORJSONResponse(status_code=status_code, content={"detail": detail})
+
+@app.exception_handler(yt_dlp.utils.DownloadError)
+async def download_error_handler(request: Request, exc: yt_dlp.utils.DownloadError):
+    status_code = 404 if _is_expected_download_error(exc) else 502
+    return _error_response(status_code, f"Error fetching video data: {exc.msg}")
+
+@app.exception_handler(TranscriptsDisabled)
+async def transcripts_disabled_handler(request: Request, exc: TranscriptsDisabled):
+    return _error_response(404, "Transcripts disabled for this video")
+
+@app.exception_handler(NoTranscriptFound)
+async def no_transcript_found_handler(request: Request, exc: NoTranscriptFound):
+    lang = request.query_params.get("lang")
+    return _error_response(404, f"No transcript found for language: {lang if lang else 'default'}")
+
+@app.exception_handler(CouldNotRetrieveTranscript)
+async def transcript_error_handler(request: Request, exc: CouldNotRetrieveTranscript):
+    return _error_response(502, f"Error fetching transcript: {exc.cause}")
 
 @app.get("/", tags=["Info"])
 async def root():
@@ -64,52 +565,35 @@ async def root():
 
 @app.get("/transcript", tags=["Transcript"])
 async def get_transcript(
-    url: str = Query(..., description="YouTube video URL"),
+    response: Response,
+    video_id: str = Depends(get_video_id),
     format: str = Query("text", description="'text' or 'json' with timestamps"),
     lang: str = Query(None, description="Language code (e.g., 'en', 'es')")
 ):
     """Fetch transcript from a YouTube video."""
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    transcript = await _get_transcript(video_id, lang)
+    cache_control = f"public, max-age={TRANSCRIPT_MAX_AGE}"
     
-    try:
-        api = YouTubeTranscriptApi()
-        
-        if lang:
-            transcript = api.fetch(video_id, languages=[lang])
-        else:
-            transcript = api.fetch(video_id)
-        
-        if format.lower() == "json":
-            result = [
-                {
-                    "text": segment.text,
-                    "start": segment.start,
-                    "duration": segment.duration
-                }
-                for segment in transcript
-            ]
-            return JSONResponse(content={
-                "video_id": video_id,
-                "transcript": result,
-                "total_segments": len(result)
-            })
-        else:
-            full_text = " ".join([segment.text for segment in transcript])
-            return PlainTextResponse(content=full_text)
-    
-    except TranscriptsDisabled:
-        raise HTTPException(status_code=404, detail="Transcripts disabled for this video")
-    except NoTranscriptFound:
-        raise HTTPException(status_code=404, detail=f"No transcript found for language: {lang if lang else 'default'}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+    if format.lower() == "json":
+        response.headers["Cache-Control"] = cache_control
+        return {
+            "video_id": video_id,
+            "transcript": transcript,
+            "total_segments": len(transcript)
+        }
+    else:
+        return StreamingResponse(
+            _stream_transcript_text(transcript),
+            media_type="text/plain",
+            headers={"Cache-Control": cache_control}
+        )
 
 @app.get("/metadata", tags=["Video Data"])
 async def get_metadata(
-    url: str = Query(..., description="YouTube video URL")
+    request: Request,
+    response: Response,
+    video_id: str = Depends(get_video_id)
 ):
     """
     Get comprehensive video metadata including:
@@ -121,53 +605,24 @@ async def get_metadata(
     NOTE: This ONLY extracts metadata - NO video download!
     """
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    metadata = await _get_metadata(video_id)
     
-    try:
-        # IMPORTANT: These options prevent any video download
-        # We only extract metadata from the YouTube page
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,  # Never download video files
-            'extract_flat': False,  # Get full metadata but no download
-            'noplaylist': True,  # Don't process playlists
-            'no_color': True
-        }
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f'https://www.youtube.com/watch?v={video_id}', download=False)
-            
-            metadata = {
-                "video_id": video_id,
-                "title": info.get('title'),
-                "description": info.get('description'),
-                "duration": info.get('duration'),
-                "duration_string": info.get('duration_string'),
-                "view_count": info.get('view_count'),
-                "like_count": info.get('like_count'),
-                "upload_date": info.get('upload_date'),
-                "uploader": info.get('uploader'),
-                "channel": info.get('channel'),
-                "channel_id": info.get('channel_id'),
-                "channel_url": info.get('channel_url'),
-                "subscriber_count": info.get('channel_follower_count'),
-                "categories": info.get('categories', []),
-                "tags": info.get('tags', []),
-                "thumbnails": info.get('thumbnails', []),
-                "webpage_url": info.get('webpage_url')
-            }
-            
-            return JSONResponse(content=metadata)
+    # The ETag follows the cached body, so clients that revalidate see new
+    # view/like counts once the server-side cache (METADATA_CACHE_TTL) expires
+    headers = {
+        "ETag": _metadata_etag(metadata),
+        "Cache-Control": f"public, max-age={METADATA_MAX_AGE}"
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching metadata: {str(e)}")
+    response.headers.update(headers)
+    return metadata
 
 @app.get("/comments", tags=["Video Data"])
 async def get_comments(
-    url: str = Query(..., description="YouTube video URL"),
+    response: Response,
+    video_id: str = Depends(get_video_id),
     max_comments: int = Query(20, description="Maximum number of comments to fetch (default: 20)")
 ):
     """
@@ -176,49 +631,18 @@ async def get_comments(
     NOTE: This ONLY extracts comments - NO video download!
     """
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    _, comments = await _get_comments(video_id, max_comments)
     
-    try:
-        # IMPORTANT: No video download - only comment extraction
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,  # Never download video
-            'getcomments': True,  # Only fetch comments
-            'noplaylist': True,
-            'extractor_args': {'youtube': {'max_comments': [str(max_comments)]}}
-        }
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f'https://www.youtube.com/watch?v={video_id}', download=False)
-            
-            comments = []
-            raw_comments = info.get('comments', [])
-            
-            for comment in raw_comments[:max_comments]:
-                comments.append({
-                    "author": comment.get('author'),
-                    "text": comment.get('text'),
-                    "like_count": comment.get('like_count'),
-                    "timestamp": comment.get('timestamp'),
-                    "is_favorited": comment.get('is_favorited', False),
-                    "parent": comment.get('parent', 'root')
-                })
-            
-            return JSONResponse(content={
-                "video_id": video_id,
-                "total_comments": len(comments),
-                "comments": comments
-            })
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching comments: {str(e)}")
+    response.headers["Cache-Control"] = f"public, max-age={COMMENTS_MAX_AGE}"
+    return {
+        "video_id": video_id,
+        "total_comments": len(comments),
+        "comments": comments
+    }
 
 @app.get("/related", tags=["Video Data"])
 async def get_related_videos(
-    url: str = Query(..., description="YouTube video URL"),
+    video_id: str = Depends(get_video_id),
     limit: int = Query(10, description="Number of related videos (default: 10)")
 ):
     """
@@ -227,50 +651,17 @@ async def get_related_videos(
     NOTE: This ONLY extracts metadata - NO video download!
     """
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
-    
-    try:
-        # IMPORTANT: No video download - only metadata
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,  # Never download video
-            'extract_flat': False,
-            'noplaylist': True
-        }
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f'https://www.youtube.com/watch?v={video_id}', download=False)
-            
-            # YouTube doesn't always provide related videos in the API
-            # But we can get some suggestions from the video info
-            related = []
-            
-            # Try to get related videos from various fields
-            if 'entries' in info:
-                for entry in info['entries'][:limit]:
-                    related.append({
-                        "video_id": entry.get('id'),
-                        "title": entry.get('title'),
-                        "channel": entry.get('channel'),
-                        "duration": entry.get('duration'),
-                        "view_count": entry.get('view_count')
-                    })
-            
-            return JSONResponse(content={
-                "video_id": video_id,
-                "related_videos": related,
-                "note": "Related videos availability depends on YouTube's API response"
-            })
+    related = await _run_blocking(_extract_related_sync, video_id, limit)
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching related videos: {str(e)}")
+    return {
+        "video_id": video_id,
+        "related_videos": related,
+        "note": "Related videos availability depends on YouTube's API response"
+    }
 
 @app.get("/full", tags=["Complete Data"])
 async def get_full_data(
-    url: str = Query(..., description="YouTube video URL"),
+    video_id: str = Depends(get_video_id),
     include_transcript: bool = Query(True, description="Include transcript"),
     include_comments: bool = Query(True, description="Include comments"),
     max_comments: int = Query(10, description="Max comments to fetch")
@@ -284,96 +675,53 @@ async def get_full_data(
     NOTE: This ONLY extracts data - NO video download!
     """
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    # Metadata (and comments, from the same yt-dlp call) and the transcript come
+    # from different services, so fetch them concurrently
+    fetches = [_get_comments(video_id, max_comments) if include_comments else _get_metadata(video_id)]
+    if include_transcript:
+        fetches.append(_get_transcript(video_id))
+    
+    meta_result, *transcript_result = await asyncio.gather(*fetches, return_exceptions=True)
     
     result = {"video_id": video_id}
     
-    # Get metadata
-    try:
-        # IMPORTANT: No video download - only metadata and comments
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,  # Never download video files
-            'getcomments': include_comments,
-            'noplaylist': True,
-            'extractor_args': {'youtube': {'max_comments': [str(max_comments)]}} if include_comments else {}
-        }
+    if isinstance(meta_result, BaseException):
+        result["metadata_error"] = str(meta_result)
+    else:
+        if include_comments:
+            metadata, comments = meta_result
+        else:
+            metadata = meta_result
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f'https://www.youtube.com/watch?v={video_id}', download=False)
-            
-            result["metadata"] = {
-                "title": info.get('title'),
-                "description": info.get('description'),
-                "duration": info.get('duration'),
-                "view_count": info.get('view_count'),
-                "like_count": info.get('like_count'),
-                "upload_date": info.get('upload_date'),
-                "channel": info.get('channel'),
-                "channel_id": info.get('channel_id'),
-                "tags": info.get('tags', []),
-                "categories": info.get('categories', [])
-            }
-            
-            # Get comments if requested
-            if include_comments:
-                comments = []
-                for comment in info.get('comments', [])[:max_comments]:
-                    comments.append({
-                        "author": comment.get('author'),
-                        "text": comment.get('text'),
-                        "like_count": comment.get('like_count')
-                    })
-                result["comments"] = comments
-    
-    except Exception as e:
-        result["metadata_error"] = str(e)
+        result["metadata"] = {key: metadata[key] for key in _FULL_METADATA_FIELDS}
+        
+        if include_comments:
+            result["comments"] = [
+                {key: comment[key] for key in _FULL_COMMENT_FIELDS}
+                for comment in comments
+            ]
     
-    # Get transcript if requested
     if include_transcript:
-        try:
-            api = YouTubeTranscriptApi()
-            transcript = api.fetch(video_id)
-            result["transcript"] = " ".join([segment.text for segment in transcript])
-        except:
+        transcript = transcript_result[0]
+        if isinstance(transcript, BaseException):
             result["transcript"] = "Not available"
+        else:
+            result["transcript"] = " ".join(segment["text"] for segment in transcript)
     
-    return JSONResponse(content=result)
+    return result
 
 @app.get("/languages", tags=["Info"])
 async def get_available_languages(
-    url: str = Query(..., description="YouTube video URL")
+    video_id: str = Depends(get_video_id)
 ):
     """Get available transcript languages for a video."""
     
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+    languages = await _run_blocking(_list_languages_sync, video_id)
     
-    try:
-        api = YouTubeTranscriptApi()
-        transcript_list = api.list(video_id)
-        
-        languages = [
-            {
-                "language": t.language,
-                "language_code": t.language_code,
-                "is_generated": t.is_generated,
-                "is_translatable": t.is_translatable
-            }
-            for t in transcript_list
-        ]
-        
-        return JSONResponse(content={
-            "video_id": video_id,
-            "available_languages": languages
-        })
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+    return {
+        "video_id": video_id,
+        "available_languages": languages
+    }
 
 @app.get("/health", tags=["Info"])
 async def health_check():
@@ -398,4 +746,13 @@ if __name__ == "__main__":
     print("=" * 50)
     print("\n")
 
-    uvicorn.run(app, host=YOUTUBE_API_HOST, port=YOUTUBE_API_PORT)
\ No newline at end of file
+    # uvloop (libuv) and httptools (C HTTP parser) are much cheaper per request
+    # than the pure-Python asyncio loop and h11. uvloop doesn't support Windows.
+    uvicorn.run(
+        app,
+        host=YOUTUBE_API_HOST,
+        port=YOUTUBE_API_PORT,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning"
+    )
\ No newline at end of file
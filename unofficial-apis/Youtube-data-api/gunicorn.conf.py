@@ -0,0 +1,21 @@
+"""
+Production server config: gunicorn -c gunicorn.conf.py data_api:app
+
+Runs several uvicorn worker processes so requests are spread across CPU
+cores. `python data_api.py` still starts a single uvicorn process for
+development.
+"""
+import os
+
+bind = f"{os.getenv('YOUTUBE_API_HOST', '0.0.0.0')}:{os.getenv('YOUTUBE_API_PORT', '8000')}"
+
+workers = int(os.getenv("YOUTUBE_API_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Keep idle client connections open longer than typical load balancer timeouts
+keepalive = 75
+
+# Import the app once in the master so the compiled regex, YouTubeTranscriptApi
+# and other module-level state are shared copy-on-write with the workers.
+# Redis connections are opened per worker in the app's lifespan.
+preload_app = True